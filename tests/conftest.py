@@ -1,8 +1,11 @@
 import boto3
 import pytest
 import logging
+from os import path as osp
+from textwrap import dedent
 
 from infrahouse_toolkit.logging import setup_logging
+from infrahouse_toolkit.terraform import terraform_apply
 
 # "303467602807" is our test account
 TEST_ACCOUNT = "303467602807"
@@ -15,6 +18,7 @@ UBUNTU_CODENAME = "jammy"
 LOG = logging.getLogger(__name__)
 REGION = "us-east-2"
 TEST_ZONE = "ci-cd.infrahouse.com"
+TERRAFORM_ROOT_DIR = "test_data"
 
 setup_logging(LOG, debug=True)
 
@@ -50,17 +54,38 @@ def ec2_client_map(ec2_client, boto3_session):
     return ec2_map
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def route53_client(boto3_session):
     return boto3_session.client("route53", region_name=REGION)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def elbv2_client(boto3_session):
     return boto3_session.client("elbv2", region_name=REGION)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def autoscaling_client(boto3_session):
     assert boto3_session.client("sts").get_caller_identity()["Account"] == TEST_ACCOUNT
     return boto3_session.client("autoscaling", region_name=REGION)
+
+
+@pytest.fixture(scope="session")
+def service_network():
+    terraform_module_dir = osp.join(TERRAFORM_ROOT_DIR, "service-network")
+    with open(osp.join(terraform_module_dir, "terraform.tfvars"), "w") as fp:
+        fp.write(
+            dedent(
+                f"""
+                role_arn = "{TEST_ROLE_ARN}"
+                region = "{REGION}"
+                """
+            )
+        )
+    with terraform_apply(
+        terraform_module_dir,
+        destroy_after=DESTROY_AFTER,
+        json_output=True,
+        enable_trace=TRACE_TERRAFORM,
+    ) as tf_service_network_output:
+        yield tf_service_network_output
@@ -11,20 +11,29 @@ from tests.conftest import (
     TEST_ZONE,
     TEST_ROLE_ARN,
     REGION,
+    TERRAFORM_ROOT_DIR,
 )
 
 
-def test_module(ec2_client, route53_client, autoscaling_client):
-    terraform_root_dir = "test_data"
+def test_module(service_network, ec2_client, route53_client, autoscaling_client):
+    LOG.info(json.dumps(service_network, indent=4))
 
-    terraform_module_dir = osp.join(terraform_root_dir, "service-network")
-    # Create service network
+    subnet_public_ids = service_network["subnet_public_ids"]["value"]
+    subnet_private_ids = service_network["subnet_private_ids"]["value"]
+    internet_gateway_id = service_network["internet_gateway_id"]["value"]
+    terraform_module_dir = osp.join(TERRAFORM_ROOT_DIR, "pypiserver")
+    # Create pypi server
     with open(osp.join(terraform_module_dir, "terraform.tfvars"), "w") as fp:
         fp.write(
             dedent(
                 f"""
                 role_arn = "{TEST_ROLE_ARN}"
                 region = "{REGION}"
+                zone_name = "{TEST_ZONE}"
+
+                subnet_public_ids = {json.dumps(subnet_public_ids)}
+                subnet_private_ids = {json.dumps(subnet_private_ids)}
+                internet_gateway_id = "{internet_gateway_id}"
                 """
             )
         )
@@ -33,32 +42,5 @@ def test_module(ec2_client, route53_client, autoscaling_client):
         destroy_after=DESTROY_AFTER,
         json_output=True,
         enable_trace=TRACE_TERRAFORM,
-    ) as tf_service_network_output:
-        LOG.info(json.dumps(tf_service_network_output, indent=4))
-
-        subnet_public_ids = tf_service_network_output["subnet_public_ids"]["value"]
-        subnet_private_ids = tf_service_network_output["subnet_private_ids"]["value"]
-        internet_gateway_id = tf_service_network_output["internet_gateway_id"]["value"]
-        terraform_module_dir = osp.join(terraform_root_dir, "pypiserver")
-        # Create pypi server
-        with open(osp.join(terraform_module_dir, "terraform.tfvars"), "w") as fp:
-            fp.write(
-                dedent(
-                    f"""
-                    role_arn = "{TEST_ROLE_ARN}"
-                    region = "{REGION}"
-                    zone_name = "{TEST_ZONE}"
-
-                    subnet_public_ids = {json.dumps(subnet_public_ids)}
-                    subnet_private_ids = {json.dumps(subnet_private_ids)}
-                    internet_gateway_id = "{internet_gateway_id}"
-                    """
-                )
-            )
-        with terraform_apply(
-            terraform_module_dir,
-            destroy_after=DESTROY_AFTER,
-            json_output=True,
-            enable_trace=TRACE_TERRAFORM,
-        ) as tf_pypiserver_output:
-            LOG.info(json.dumps(tf_pypiserver_output, indent=4))
+    ) as tf_pypiserver_output:
+        LOG.info(json.dumps(tf_pypiserver_output, indent=4))